@@ -0,0 +1,60 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional C fast path for the per-interval loop in `ipa_to_arpabet.py`.
+
+Build in place with `cythonize -i _convert_c.pyx`; when the extension is not
+built, `ipa_to_arpabet` uses its pure-Python loop with identical results.
+"""
+
+from cpython.dict cimport PyDict_GetItem, PyDict_Next, PyDict_SetItem
+from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE
+from cpython.object cimport Py_NE, PyObject, PyObject_RichCompareBool
+
+cdef object _TEXT = "text"
+
+
+cdef inline bint _convert_item(object it, dict table, object convert) except -1:
+    cdef PyObject* slot
+    cdef object t, new
+
+    if not isinstance(it, dict):
+        return False
+    slot = PyDict_GetItem(it, _TEXT)
+    if slot is NULL:
+        return False
+    t = <object>slot
+
+    # Unhashable values simply miss here and are skipped below.
+    slot = PyDict_GetItem(table, t)
+    if slot is not NULL:
+        new = <object>slot
+    elif isinstance(t, str):
+        new = convert(t)
+    else:
+        return False
+
+    if PyObject_RichCompareBool(new, t, Py_NE):
+        PyDict_SetItem(it, _TEXT, new)
+        return True
+    return False
+
+
+cpdef bint convert_intervals(object container, dict table, object convert) except -1:
+    """In-place conversion of a dict or list of interval objects.
+
+    `table` is the prebuilt phone lookup and `convert` the full converter used
+    on misses (both from `_make_converter`). Returns True if any 'text' changed.
+    """
+    cdef Py_ssize_t i, pos = 0
+    cdef PyObject* key
+    cdef PyObject* value
+    cdef bint dirty = False
+
+    if isinstance(container, list):
+        for i in range(PyList_GET_SIZE(container)):
+            if _convert_item(<object>PyList_GET_ITEM(container, i), table, convert):
+                dirty = True
+    elif isinstance(container, dict):
+        while PyDict_Next(container, &pos, &key, &value):
+            if _convert_item(<object>value, table, convert):
+                dirty = True
+    return dirty
@@ -21,9 +21,38 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
+import os
+import shutil
+import sys
+import tempfile
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the stdlib json module.
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; only needed for --stream.
+    ijson = None
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; a pure-Python scan is used instead.
+    ahocorasick = None
+
+try:
+    from _convert_c import convert_intervals as _convert_intervals_c
+except ImportError:  # Optional; build with `cythonize -i _convert_c.pyx`.
+    _convert_intervals_c = None
 
 
 VOWEL_BASES = {
@@ -116,13 +145,45 @@ IPA_TO_ARPABET: Dict[str, str] = {
     "sil": "sil",
 }
 
+# Inputs may arrive in any Unicode normalization form; keys are stored as NFC
+# and incoming phones are normalized to match (see `_nfc`).
+IPA_TO_ARPABET = {unicodedata.normalize("NFC", k): v for k, v in IPA_TO_ARPABET.items()}
 
-_ARPABET_RE = re.compile(r"^[A-Z]{1,3}[0-2]?$")
+# IPA-like -> (uppercase ARPABET, whether the default stress digit is
+# appended). Vowel-ness is fixed per entry, so it is resolved once here.
+_IPA_TO_ARPABET_RESOLVED: Dict[str, Tuple[str, bool]] = {
+    k: (v.upper(), v.upper() in VOWEL_BASES) for k, v in IPA_TO_ARPABET.items()
+}
+
+# Vowel base -> its stress-marked forms, indexed by stress digit, so stressed
+# output is never formatted per call.
+_STRESSED_VOWELS: Dict[str, Tuple[str, str, str]] = {
+    base: (f"{base}0", f"{base}1", f"{base}2") for base in VOWEL_BASES
+}
+
+# Every ARPABET symbol this module can emit: vowel bases with and without a
+# stress digit, plus the consonants.
+_ARPABET_SYMBOLS = frozenset(
+    list(VOWEL_BASES)
+    + [v for forms in _STRESSED_VOWELS.values() for v in forms]
+    + [v for v in IPA_TO_ARPABET.values() if v.isupper()]
+)
+
+
+@lru_cache(maxsize=2048)
+def _nfc(s: str) -> str:
+    # The quick check avoids building a new string for already-NFC input.
+    return s if unicodedata.is_normalized("NFC", s) else unicodedata.normalize("NFC", s)
 
 
 def _looks_like_arpabet(s: str) -> bool:
+    # Equivalent to matching `^[A-Z]{1,3}[0-2]?$`, without a regex call.
     s = s.strip().upper()
-    return s == "SPN" or bool(_ARPABET_RE.match(s))
+    n = len(s)
+    if n == 0 or n > 4:
+        return False
+    body = s[:-1] if s[-1] in "012" else s
+    return 1 <= len(body) <= 3 and body.isascii() and body.isalpha()
 
 
 def ipa_phone_to_arpabet(phone: str, default_stress: int | None) -> str:
@@ -137,6 +198,13 @@ def ipa_phone_to_arpabet(phone: str, default_stress: int | None) -> str:
     - Otherwise, if the mapped base is a vowel base and `default_stress` is not
       None, append that stress digit.
     """
+    return _ipa_phone_to_arpabet_cached(phone, default_stress)
+
+
+@lru_cache(maxsize=4096)
+def _ipa_phone_to_arpabet_cached(phone: str, default_stress: int | None) -> str:
+    # The phone inventory is tiny and repeats across every interval of a
+    # corpus, so nearly every call after the first is a cache hit.
     raw = phone
     p = (phone or "").strip()
     if not p:
@@ -146,86 +214,244 @@ def ipa_phone_to_arpabet(phone: str, default_stress: int | None) -> str:
     if p.lower() in {"spn", "sil"}:
         return p.lower()
 
+    # Normalize to NFC so composed/decomposed forms hit the same key.
+    # (Keep this minimal; avoid aggressive IPA rewriting.)
+    p_norm = _nfc(p)
+
+    # Direct mapping. This is checked before the ARPABET test so that the
+    # ASCII-only MFA phones (`aj`, `ow`, `i`, ...) are not mistaken for
+    # ARPABET symbols.
+    hit = _IPA_TO_ARPABET_RESOLVED.get(p_norm)
+
     # If already ARPABET-like, normalize case.
-    if _looks_like_arpabet(p):
+    if hit is None and _looks_like_arpabet(p):
         up = p.upper()
         return "spn" if up == "SPN" else up
 
-    # Normalize a few common Unicode sequences.
-    # (Keep this minimal; avoid aggressive IPA rewriting.)
-    p_norm = p
-
-    # Direct mapping.
-    base = IPA_TO_ARPABET.get(p_norm)
-    if base is None:
+    if hit is None:
         # Try lowercase; MFA phones are often lowercase.
-        base = IPA_TO_ARPABET.get(p_norm.lower())
+        hit = _IPA_TO_ARPABET_RESOLVED.get(p_norm.lower())
 
-    if base is None:
-        # Unknown: leave unchanged.
-        return p
-
-    # Explicit stress in mapping.
-    if base.upper().endswith(("0", "1", "2")):
-        return base.upper()
-
-    base_up = base.upper()
+    if hit is None:
+        # Unknown: leave unchanged (the very same object, so callers can
+        # skip the write-back).
+        return raw
 
-    # Apply default stress to vowel bases if requested.
-    if base_up in VOWEL_BASES and default_stress is not None:
+    # Explicitly stressed mappings (AH0/ER0) and consonants are used as-is;
+    # vowel bases get the default stress if requested.
+    base_up, needs_stress = hit
+    if needs_stress and default_stress is not None:
+        if type(default_stress) is int and 0 <= default_stress <= 2:
+            return _STRESSED_VOWELS[base_up][default_stress]
+        # Outside the precomputed 0/1/2 forms; format as before.
         return f"{base_up}{default_stress}"
 
     return base_up
 
 
-def _convert_interval_container(container: Any, default_stress: int | None) -> None:
+def _build_lookup(default_stress: int | None) -> Dict[str, str]:
+    """Resolve every known phone to its ARPABET output for one stress setting.
+
+    `default_stress` is fixed for a whole run, so the full mapping can be
+    materialized once and each interval reduced to a single dict lookup.
+    Besides the IPA keys, the table holds identity entries for ARPABET
+    symbols (with and without stress digits) and the noise tokens. Anything
+    not in the table falls back to `ipa_phone_to_arpabet`.
+
+    Values are interned, so every interval with the same output shares one
+    string object.
+    """
+    keys = set(IPA_TO_ARPABET)
+    keys.update(("SPN", "SIL"))
+    for value in IPA_TO_ARPABET.values():
+        base_up = value.upper().rstrip("012")
+        keys.add(base_up)
+        if base_up in VOWEL_BASES:
+            keys.update(_STRESSED_VOWELS[base_up])
+    return {k: sys.intern(_ipa_phone_to_arpabet_cached(k, default_stress)) for k in keys}
+
+
+@lru_cache(maxsize=None)
+def _make_converter(default_stress: int | None) -> Callable[[Any], Any]:
+    """Return a phone converter specialized for one `default_stress`.
+
+    The returned function resolves known phones with a single lookup in the
+    prebuilt table and only falls back to `ipa_phone_to_arpabet` for
+    unknown strings; non-string values are returned unchanged. Unhashable
+    values raise TypeError from the lookup.
+    """
+    table = _build_lookup(default_stress)
+
+    def convert(t: Any, _get=table.get, _fallback=_ipa_phone_to_arpabet_cached) -> Any:
+        return _get(t) or (_fallback(t, default_stress) if isinstance(t, str) else t)
+
+    # Exposed for the optional C loop, which does the table lookup itself.
+    convert.table = table
+    return convert
+
+
+_MAX_IPA_KEY_LEN = max(map(len, IPA_TO_ARPABET))
+_SINGLE_CODEPOINT_PHONES = frozenset(k for k in IPA_TO_ARPABET if len(k) == 1)
+_MULTI_CODEPOINT_PHONES = tuple(k for k in IPA_TO_ARPABET if len(k) > 1)
+
+
+@lru_cache(maxsize=None)
+def _single_phone_translation(default_stress: int | None) -> Dict[int, str]:
+    # Codepoint -> "ARPABET " for every single-codepoint phone, so a token
+    # made only of such phones converts in one str.translate call.
+    return str.maketrans(
+        {
+            k: _ipa_phone_to_arpabet_cached(k, default_stress) + " "
+            for k in _SINGLE_CODEPOINT_PHONES
+        }
+    )
+
+
+@lru_cache(maxsize=None)
+def _phone_automaton() -> Any:
+    automaton = ahocorasick.Automaton()
+    for key in IPA_TO_ARPABET:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+
+def _split_phone_run(run: str) -> List[str]:
+    """Split concatenated IPA-like phones by leftmost-longest match.
+
+    Runs of characters that start no known phone are kept together as one
+    segment; callers leave such segments unchanged.
+    """
+    segments: List[str] = []
+    pos = 0
+    if ahocorasick is not None:
+        for end, key in _phone_automaton().iter_long(run):
+            start = end - len(key) + 1
+            if start > pos:
+                segments.append(run[pos:start])
+            segments.append(key)
+            pos = end + 1
+    else:
+        n = len(run)
+        i = 0
+        while i < n:
+            for size in range(min(_MAX_IPA_KEY_LEN, n - i), 0, -1):
+                key = run[i : i + size]
+                if key in IPA_TO_ARPABET:
+                    if i > pos:
+                        segments.append(run[pos:i])
+                    segments.append(key)
+                    i = pos = i + size
+                    break
+            else:
+                i += 1
+    if pos < len(run):
+        segments.append(run[pos:])
+    return segments
+
+
+def ipa_sequence_to_arpabet(seq: str, default_stress: int | None) -> str:
+    """Convert a sequence of IPA-like phones to space-separated ARPABET.
+
+    Phones may be separated by whitespace, concatenated (e.g. `tʃaɪ`), or
+    both. Tokens that are already a single known phone (or an ARPABET
+    symbol) are converted directly; other tokens are split into phones
+    first, so `hi` becomes `HH IY1` rather than being read as ARPABET.
+    Unknown characters are left unchanged.
+    """
+    out: List[str] = []
+    for token in unicodedata.normalize("NFC", seq).split():
+        if token in IPA_TO_ARPABET or token in _ARPABET_SYMBOLS:
+            out.append(_ipa_phone_to_arpabet_cached(token, default_stress))
+            continue
+        if token.lower() in IPA_TO_ARPABET:
+            out.append(_ipa_phone_to_arpabet_cached(token.lower(), default_stress))
+            continue
+        if _SINGLE_CODEPOINT_PHONES.issuperset(token) and not any(
+            k in token for k in _MULTI_CODEPOINT_PHONES
+        ):
+            table = _single_phone_translation(default_stress)
+            out.append(token.translate(table).rstrip())
+            continue
+        for phone in _split_phone_run(token):
+            if phone in IPA_TO_ARPABET:
+                out.append(_ipa_phone_to_arpabet_cached(phone, default_stress))
+            else:
+                out.append(phone)
+    return " ".join(out)
+
+
+def _convert_interval_container(container: Any, convert: Callable[[Any], Any]) -> bool:
     """In-place conversion for a container that holds interval objects.
 
     Accepts either:
     - dict[str, {xmin,xmax,text,...}]
     - list[{xmin,xmax,text,...}]
 
-    Only the 'text' field is modified.
+    Only the 'text' field is modified, using `convert` from
+    `_make_converter`. Returns True if any 'text' changed.
     """
+    table = getattr(convert, "table", None)
+    if _convert_intervals_c is not None and table is not None:
+        return _convert_intervals_c(container, table, convert)
+
     if isinstance(container, dict):
         items = container.values()
     elif isinstance(container, list):
         items = container
     else:
-        return
+        return False
 
+    # This loop runs once per interval in the corpus; keep it minimal.
+    dirty = False
     for it in items:
-        if isinstance(it, dict) and "text" in it and isinstance(it["text"], str):
-            it["text"] = ipa_phone_to_arpabet(it["text"], default_stress)
-
-
-def convert_json_obj(obj: Any, default_stress: int | None) -> Any:
-    """Convert IPA-like phones to ARPABET in a loaded JSON object.
+        try:
+            t = it["text"]
+        except (TypeError, KeyError):
+            # Not a dict, or no 'text'.
+            continue
+        if t.__class__ is not str:
+            continue
+        new = convert(t)
+        if new != t:
+            it["text"] = new
+            dirty = True
+    return dirty
 
-    Supports:
-    - per-file object with keys including 'words'/'phones'
-    - filename->per-file mapping
 
-    The conversion applies to the `phones` field under each per-file object.
-    """
+def _convert_obj(obj: Any, convert: Callable[[Any], Any]) -> bool:
+    """In-place body of `convert_json_obj`; returns True if anything changed."""
 
-    def convert_per_file(per_file: Dict[str, Any]) -> None:
+    def convert_per_file(per_file: Dict[str, Any]) -> bool:
         if "phones" in per_file:
-            _convert_interval_container(per_file["phones"], default_stress)
+            return _convert_interval_container(per_file["phones"], convert)
+        return False
 
     if isinstance(obj, dict) and "words" in obj and "phones" in obj:
         # Single-file object.
-        convert_per_file(obj)
-        return obj
+        return convert_per_file(obj)
 
+    dirty = False
     if isinstance(obj, dict):
         # filename -> per-file
         for _, per_file in obj.items():
             if isinstance(per_file, dict):
-                convert_per_file(per_file)
-        return obj
+                dirty |= convert_per_file(per_file)
+
+    # Unknown top-level types are left untouched.
+    return dirty
+
+
+def convert_json_obj(obj: Any, default_stress: int | None) -> Any:
+    """Convert IPA-like phones to ARPABET in a loaded JSON object.
+
+    Supports:
+    - per-file object with keys including 'words'/'phones'
+    - filename->per-file mapping
 
-    # Unknown top-level type.
+    The conversion applies to the `phones` field under each per-file object.
+    """
+    _convert_obj(obj, _make_converter(default_stress))
     return obj
 
 
@@ -237,25 +463,232 @@ def _default_outdir_for_dir(in_dir: Path) -> Path:
     return in_dir.parent / f"{in_dir.name}_arpa"
 
 
-def _iter_json_files(root: Path) -> Iterable[Path]:
-    # Recursive walk; skip hidden directories.
-    for p in root.rglob("*.json"):
-        if any(part.startswith(".") for part in p.parts):
-            continue
-        if p.is_file():
-            yield p
+def _iter_json_files(root: str) -> Iterable[str]:
+    # Recursive walk; skip hidden directories and files, and anything that is
+    # not a regular file (e.g. dangling symlinks). scandir entries carry the
+    # type from the directory listing, so only symlinks need an extra stat.
+    # Paths stay plain strings; building Path objects per file is wasted work.
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif name.endswith(".json") and entry.is_file():
+                    yield entry.path
+
+
+def _read_bytes(path: str | Path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _loads(data: bytes) -> Tuple[Any, bool]:
+    """Parse JSON bytes; also return whether the stdlib parser was needed.
+
+    orjson rejects some documents that `json` accepts (NaN/Infinity,
+    integers beyond 64 bits). Those are parsed with `json` and should be
+    re-encoded with it too (`_dumps(..., stdlib=True)`), so installing
+    orjson never turns a previously valid input into an error.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data), False
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data), True
+
+
+def _dumps(obj: Any, newline: bool = True, stdlib: bool = False) -> bytes:
+    # UTF-8, 2-space indent, optional trailing newline. The layout is the same
+    # either way, but orjson spells some floats differently from `json`
+    # (e.g. 0.00001 vs 1e-05, 1e16 vs 1e+16).
+    if orjson is not None and not stdlib:
+        option = orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; `json` handles them.
+    text = json.dumps(obj, ensure_ascii=False, indent=2)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+# Output directories already created by this process. Many files share a
+# directory, so this saves a makedirs (and its stat calls) per file.
+_MKDIR_CACHE: Set[str] = set()
+
+
+def _makedirs_for(path: str) -> None:
+    parent = os.path.dirname(path)
+    if parent and parent not in _MKDIR_CACHE:
+        os.makedirs(parent, exist_ok=True)
+        _MKDIR_CACHE.add(parent)
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
 
 
-def _read_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+# Process umask, read once at import (reading it means briefly changing it,
+# which is not safe once writer threads are running).
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
-def _write_json(path: Path, obj: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+@contextmanager
+def _atomic_open(path: str | Path) -> Iterator[BinaryIO]:
+    """Open a temporary sibling of `path` for writing; move it into place on exit.
+
+    Symlinks are resolved so the real target is updated, and the permission
+    bits of an existing target are kept (new files get the umask default).
+    On error the temporary file is removed and `path` is left untouched.
+    """
+    path = os.path.realpath(path)
+    _makedirs_for(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        else:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+
+
+def _write_bytes(path: str | Path, data: bytes) -> None:
+    # Write the encoded document in one go, so outputs are never left
+    # half-written.
+    with _atomic_open(path) as f:
+        f.write(data)
+
+
+def _convert_file(
+    in_file: str | Path, out_file: str | Path, convert: Callable[[Any], Any]
+) -> None:
+    """Convert one JSON file, skipping re-serialization if nothing changed.
+
+    Unchanged inputs are written back verbatim (or left alone when converting
+    in-place), which makes re-running over converted output cheap.
+    """
+    data = _read_bytes(in_file)
+    obj, stdlib = _loads(data)
+    if _convert_obj(obj, convert):
+        _write_bytes(out_file, _dumps(obj, stdlib=stdlib))
+    elif out_file != in_file:
+        # Unchanged: the bytes already read are the verbatim copy. This is
+        # also safe when `out_file` names the input under another spelling.
+        _write_bytes(out_file, data)
+
+
+class _NotStreamable(Exception):
+    """Raised mid-stream when an input must be converted as a whole instead."""
+
+
+def _stream_convert_file(
+    in_file: str | Path, out_file: str | Path, convert: Callable[[Any], Any]
+) -> None:
+    """Convert a large filename->per-file JSON one entry at a time.
+
+    Only a single per-file record is held in memory. The output has the same
+    layout as `_convert_file`; it is written through `_atomic_open`, so
+    in-place conversion is safe. Inputs that cannot be streamed (top level
+    not an object, single-file objects, or JSON that ijson rejects but the
+    regular parser accepts, such as NaN) are handed to `_convert_file`.
+    """
+    try:
+        with open(in_file, "rb") as fin:
+            first = next(ijson.parse(fin), None)
+        if first is None or first[:2] != ("", "start_map"):
+            # Only a top-level object can be streamed entry by entry.
+            raise _NotStreamable
+
+        with open(in_file, "rb") as fin, _atomic_open(out_file) as fout:
+            fout.write(b"{")
+            sep = b"\n  "
+            for key, value in ijson.kvitems(fin, "", use_float=True):
+                if key == "phones":
+                    # A top-level 'phones' key means a single-file object
+                    # (see `_convert_obj`), which gains nothing from
+                    # streaming; discard the partial output.
+                    raise _NotStreamable
+                if isinstance(value, dict) and "phones" in value:
+                    _convert_interval_container(value["phones"], convert)
+                # Re-indent the nested value by one level to match `_dumps`.
+                entry = _dumps(value, newline=False).replace(b"\n", b"\n  ")
+                fout.write(sep + _dumps(key, newline=False) + b": " + entry)
+                sep = b",\n  "
+            fout.write(b"}\n" if sep == b"\n  " else b"\n}\n")
+    except (_NotStreamable, ijson.JSONError):
+        # Nothing has been written; `_convert_file` reports truly invalid JSON.
+        _convert_file(in_file, out_file, convert)
+
+
+def _convert_files_pipelined(
+    files: List[str],
+    in_root: str,
+    out_dir: str,
+    convert: Callable[[Any], Any],
+    window: int = 8,
+) -> None:
+    """Convert files one by one while a thread pool reads ahead and writes behind.
+
+    Up to `window` input files are read in the background while the current
+    one is parsed and converted, and finished outputs are written by the
+    pool, so disk I/O overlaps with conversion. Output matches `_convert_file`.
+    """
+    with ThreadPoolExecutor(max_workers=window) as pool:
+        remaining = iter(files)
+        reads = deque(
+            (in_file, pool.submit(_read_bytes, in_file))
+            for in_file in islice(remaining, window)
+        )
+        writes = []
+        while reads:
+            in_file, pending = reads.popleft()
+            nxt = next(remaining, None)
+            if nxt is not None:
+                reads.append((nxt, pool.submit(_read_bytes, nxt)))
+
+            data = pending.result()
+            out_file = os.path.join(out_dir, os.path.relpath(in_file, in_root))
+            obj, stdlib = _loads(data)
+            if _convert_obj(obj, convert):
+                writes.append(pool.submit(_write_bytes, out_file, _dumps(obj, stdlib=stdlib)))
+            elif out_file != in_file:
+                # Unchanged: the bytes already read are the verbatim copy.
+                writes.append(pool.submit(_write_bytes, out_file, data))
+
+        # Re-raise any write error.
+        for done in writes:
+            done.result()
+
+
+# Per-process converter for `_process_one`, set once by `_init_worker` so the
+# lookup table is built in each worker instead of pickled with every task.
+_CONVERT: Callable[[Any], Any] | None = None
+
+
+def _init_worker(default_stress: int | None) -> None:
+    global _CONVERT
+    _CONVERT = _make_converter(default_stress)
+
+
+def _process_one(in_file: str, in_root: str, out_dir: str) -> None:
+    """Read, convert and write one JSON file of a directory run."""
+    rel = os.path.relpath(in_file, in_root)
+    _convert_file(in_file, os.path.join(out_dir, rel), _CONVERT)
 
 
 def main() -> int:
@@ -303,6 +736,23 @@ def main() -> int:
             "are always emitted as 0." 
         ),
     )
+    ap.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Stream-convert a single large filename->per-file JSON without "
+            "loading it fully (only valid when input is a file; needs ijson)."
+        ),
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=(
+            "Number of worker processes for directory input. "
+            "Default: number of CPUs; 1 converts files serially."
+        ),
+    )
 
     args = ap.parse_args()
 
@@ -318,6 +768,9 @@ def main() -> int:
         if default_stress not in (0, 1, 2):
             raise SystemExit("--default_stress must be 0, 1, 2, or 'none'")
 
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be at least 1")
+
     if not in_path.exists():
         raise SystemExit(f"Input path not found: {in_path}")
 
@@ -326,23 +779,38 @@ def main() -> int:
             raise SystemExit("--out_dir is only valid when input is a directory")
         out_path = in_path if args.inplace else Path(args.out).expanduser() if args.out else _default_outfile_for_file(in_path)
 
-        obj = _read_json(in_path)
-        obj = convert_json_obj(obj, default_stress=default_stress)
-        _write_json(out_path, obj)
+        if args.stream:
+            if ijson is None:
+                raise SystemExit("--stream requires the 'ijson' package")
+            _stream_convert_file(in_path, out_path, _make_converter(default_stress))
+        else:
+            _convert_file(in_path, out_path, _make_converter(default_stress))
         return 0
 
     if in_path.is_dir():
         if args.out is not None:
             raise SystemExit("--out is only valid when input is a file")
+        if args.stream:
+            raise SystemExit("--stream is only valid when input is a file")
         out_dir = in_path if args.inplace else Path(args.out_dir).expanduser() if args.out_dir else _default_outdir_for_dir(in_path)
 
-        for in_file in _iter_json_files(in_path):
-            rel = in_file.relative_to(in_path)
-            out_file = out_dir / rel
+        in_root, out_root = os.fspath(in_path), os.fspath(out_dir)
+        files = list(_iter_json_files(in_root))
+
+        if args.jobs == 1 or len(files) <= 1:
+            _convert_files_pipelined(files, in_root, out_root, _make_converter(default_stress))
+            return 0
+
+        process = partial(_process_one, in_root=in_root, out_dir=out_root)
 
-            obj = _read_json(in_file)
-            obj = convert_json_obj(obj, default_stress=default_stress)
-            _write_json(out_file, obj)
+        with ProcessPoolExecutor(
+            max_workers=args.jobs,
+            initializer=_init_worker,
+            initargs=(default_stress,),
+        ) as executor:
+            # Drain the iterator so worker exceptions are re-raised here.
+            for _ in executor.map(process, files, chunksize=32):
+                pass
 
         return 0
 